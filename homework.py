@@ -1,10 +1,16 @@
-from dataclasses import dataclass, asdict, fields
-from typing import List
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Iterable, List, Tuple
+
+import numpy as np
 
 
 @dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
@@ -12,15 +18,21 @@ class InfoMessage:
     calories: float
 
     MESSAGE_TEMPLATE = (
-        'Тип тренировки: {training_type}; '
-        'Длительность: {duration:.3f} ч.; '
-        'Дистанция: {distance:.3f} км; '
-        'Ср. скорость: {speed:.3f} км/ч; '
-        'Потрачено ккал: {calories:.3f}.'
+        'Тип тренировки: %s; '
+        'Длительность: %.3f ч.; '
+        'Дистанция: %.3f км; '
+        'Ср. скорость: %.3f км/ч; '
+        'Потрачено ккал: %.3f.'
     )
 
     def get_message(self) -> str:
-        return self.MESSAGE_TEMPLATE.format(**asdict(self))
+        return self.MESSAGE_TEMPLATE % (
+            self.training_type,
+            self.duration,
+            self.distance,
+            self.speed,
+            self.calories
+        )
 
 
 M_IN_KM = 1000
@@ -37,23 +49,57 @@ class Training:
     LEN_STEP = 0.65
     M_IN_KM = M_IN_KM
     MIN_IN_H = MIN_IN_H
+    TRAINING_TYPE = 'Training'
+    N_INPUT_FIELDS: ClassVar[int] = 3
+
+    # Запомненные дистанция и скорость; до первого расчёта берутся
+    # значения класса, так что __init__ их не трогает.
+    _distance = None
+    _speed = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.TRAINING_TYPE = cls.__name__
+
+    def reset_cache(self) -> None:
+        """Сбросить запомненные дистанцию и скорость.
+
+        Вызывать после изменения данных тренировки.
+        """
+        self._distance = None
+        self._speed = None
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / M_IN_KM
+        if self._distance is None:
+            self._distance = self.action * self.LEN_STEP / M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration
+        if self._speed is None:
+            self._speed = self.get_distance() / self.duration
+        return self._speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
         pass
 
+    @classmethod
+    def calories_batch(cls, *columns: np.ndarray) -> np.ndarray:
+        """Посчитать калории сразу для массива тренировок.
+
+        Колонки передаются в порядке полей тренировки; формулы те же,
+        что и в get_spent_calories, только над массивами.
+        """
+        return cls(
+            *(np.asarray(column, dtype=np.float64) for column in columns)
+        ).get_spent_calories()
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
         return InfoMessage(
-            type(self).__name__,
+            self.TRAINING_TYPE,
             self.duration,
             self.get_distance(),
             self.get_mean_speed(),
@@ -80,6 +126,7 @@ class Running(Training):
 @dataclass
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
+    N_INPUT_FIELDS: ClassVar[int] = 4
     CALORIES_WEIGHT_MULTIPLIER = 0.035
     CALORIES_SPEED_HEIGHT_MULTIPLIER = 0.029
     CM_IN_M = 100
@@ -102,6 +149,7 @@ class SportsWalking(Training):
 @dataclass
 class Swimming(Training):
     """Тренировка: плавание."""
+    N_INPUT_FIELDS: ClassVar[int] = 5
     LEN_STEP = 1.38
     CALORIES_MEAN_SPEED_SHIFT = 1.1
     CALORIES_WEIGHT_MULTIPLIER = 2
@@ -110,12 +158,14 @@ class Swimming(Training):
     length_pool: float
 
     def get_mean_speed(self) -> float:
-        return (
-            self.length_pool
-            * self.count_pool
-            / M_IN_KM
-            / self.duration
-        )
+        if self._speed is None:
+            self._speed = (
+                self.length_pool
+                * self.count_pool
+                / M_IN_KM
+                / self.duration
+            )
+        return self._speed
 
     def get_spent_calories(self) -> float:
         return (
@@ -129,10 +179,26 @@ class Swimming(Training):
         )
 
 
-TRAIN_CLASSES_COUNT_TYPES = {
-    'RUN': [Running, len(fields(Running))],
-    'WLK': [SportsWalking, len(fields(SportsWalking))],
-    'SWM': [Swimming, len(fields(Swimming))]
+TRAIN_CLASSES = {
+    'RUN': Running,
+    'WLK': SportsWalking,
+    'SWM': Swimming
+}
+
+RUN_DTYPE = np.dtype([
+    ('action', 'f8'), ('duration', 'f8'), ('weight', 'f8')
+])
+WLK_DTYPE = np.dtype([
+    ('action', 'f8'), ('duration', 'f8'), ('weight', 'f8'), ('height', 'f8')
+])
+SWM_DTYPE = np.dtype([
+    ('action', 'f8'), ('duration', 'f8'), ('weight', 'f8'),
+    ('count_pool', 'f8'), ('length_pool', 'f8')
+])
+TRAIN_DTYPES = {
+    'RUN': RUN_DTYPE,
+    'WLK': WLK_DTYPE,
+    'SWM': SWM_DTYPE
 }
 
 
@@ -143,22 +209,62 @@ ERROR_WRONG_NUMBER = (
 )
 
 
-def read_package(workout_type: str, data: List[int]) -> Training:
-    """Прочитать данные полученные от датчиков."""
-    if workout_type not in TRAIN_CLASSES_COUNT_TYPES.keys():
+def _get_training_class(
+    workout_type: str,
+    n_fields: int
+) -> Tuple[str, type]:
+    """Найти класс тренировки и проверить количество входных параметров.
+
+    Возвращает интернированный код тренировки вместе с её классом.
+    """
+    try:
+        training_class = TRAIN_CLASSES[workout_type]
+    except (KeyError, TypeError):
         raise ValueError(
             ERROR_MESSAGE_MISS.format(workout_type)
-        )
-    if len(data) != TRAIN_CLASSES_COUNT_TYPES[workout_type][1]:
+        ) from None
+    # Подклассы str (например, numpy.str_) приводятся к str:
+    # sys.intern принимает только точный str.
+    workout_type = sys.intern(str(workout_type))
+    if n_fields != training_class.N_INPUT_FIELDS:
         raise ValueError(
-            ERROR_WRONG_NUMBER.format(
-                len(data),
-                TRAIN_CLASSES_COUNT_TYPES[workout_type][0]
-            )
+            ERROR_WRONG_NUMBER.format(n_fields, training_class)
         )
-    return (
-        TRAIN_CLASSES_COUNT_TYPES[workout_type][0](*data)
-    )
+    return workout_type, training_class
+
+
+def read_package(workout_type: str, data: List[int]) -> Training:
+    """Прочитать данные полученные от датчиков."""
+    _, training_class = _get_training_class(workout_type, len(data))
+    return training_class(*data)
+
+
+def read_package_batch(workout_type: str, data) -> np.ndarray:
+    """Посчитать калории для пачки пакетов одного вида тренировки."""
+    data = np.atleast_2d(np.asarray(data, dtype=np.float64))
+    _, training_class = _get_training_class(workout_type, data.shape[1])
+    return training_class.calories_batch(*data.T)
+
+
+def read_packages(
+    packages: Iterable[Tuple[str, List[int]]]
+) -> Dict[str, np.ndarray]:
+    """Посчитать калории для пакетов, сгруппировав их по тренировкам.
+
+    Внутри каждого вида тренировки калории идут в том же порядке,
+    что и пакеты этого вида во входных данных.
+    """
+    grouped = defaultdict(list)
+    for workout_type, data in packages:
+        workout_type, _ = _get_training_class(workout_type, len(data))
+        grouped[workout_type].append(tuple(data))
+    calories = {}
+    for workout_type, rows in grouped.items():
+        batch = np.array(rows, dtype=TRAIN_DTYPES[workout_type])
+        calories[workout_type] = TRAIN_CLASSES[workout_type].calories_batch(
+            *(batch[name] for name in batch.dtype.names)
+        )
+    return calories
 
 
 def main(training: Training) -> None:
@@ -173,11 +279,8 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        main(
-            read_package
-            (
-                workout_type,
-                data
-            )
-        )
+    messages = [
+        read_package(workout_type, data).show_training_info().get_message()
+        for workout_type, data in packages
+    ]
+    sys.stdout.write('\n'.join(messages) + '\n')
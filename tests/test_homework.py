@@ -1,7 +1,10 @@
 import re
 import pytest
 import types
+import dataclasses
 import inspect
+
+import numpy as np
 from conftest import Capturing
 
 try:
@@ -421,3 +424,122 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+])
+def test_read_package_batch(input_data):
+    workout_type, data = input_data
+    expected = homework.read_package(*input_data).get_spent_calories()
+    result = homework.read_package_batch(workout_type, [data, data])
+    assert list(result) == [expected, expected], (
+        'Функция `read_package_batch` должна считать калории '
+        'так же, как и `get_spent_calories`.'
+    )
+
+
+def test_read_packages():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+        ('RUN', [15000, 1, 75]),
+    ]
+    result = homework.read_packages(packages)
+    for workout_type in ('SWM', 'RUN', 'WLK'):
+        expected = [
+            homework.read_package(*package).get_spent_calories()
+            for package in packages if package[0] == workout_type
+        ]
+        assert list(result[workout_type]) == expected, (
+            'Функция `read_packages` должна считать калории '
+            'так же, как и `get_spent_calories`.'
+        )
+
+
+@pytest.mark.parametrize('training_class', [
+    'Running', 'SportsWalking', 'Swimming',
+])
+def test_N_INPUT_FIELDS(training_class):
+    training = getattr(homework, training_class)
+    assert training.N_INPUT_FIELDS == len(dataclasses.fields(training)), (
+        f'`{training_class}.N_INPUT_FIELDS` должен совпадать '
+        'с количеством полей тренировки.'
+    )
+
+
+def test_calories_use_class_constants():
+    @dataclasses.dataclass
+    class SlowRunning(homework.Running):
+        CALORIES_MEAN_SPEED_SHIFT = 0
+
+    running = SlowRunning(9000, 1, 75)
+    batch = SlowRunning.calories_batch(
+        *(np.array([value], dtype=float) for value in (9000, 1, 75))
+    )
+    assert running.get_spent_calories() == 473.85, (
+        'Формула калорий должна брать константы из класса тренировки.'
+    )
+    assert list(batch) == [473.85], (
+        '`calories_batch` должен брать константы из класса тренировки.'
+    )
+
+
+def test_Training_cache_reset_on_change():
+    training = homework.Running(9000, 1, 75)
+    assert training.get_mean_speed() == 5.85
+    training.action = 1000
+    training.reset_cache()
+    assert training.get_distance() == 0.65, (
+        'После `reset_cache` дистанция '
+        'должна пересчитываться.'
+    )
+    assert training.get_mean_speed() == 0.65, (
+        'После `reset_cache` средняя скорость '
+        'должна пересчитываться.'
+    )
+
+
+@pytest.mark.parametrize('workout_type', [None, b'RUN', 'JMP'])
+def test_read_package_unknown_type(workout_type):
+    for read in (homework.read_package, homework.read_package_batch):
+        with pytest.raises(ValueError):
+            read(workout_type, [9000, 1, 75])
+    with pytest.raises(ValueError):
+        homework.read_packages([(workout_type, [9000, 1, 75])])
+
+
+def test_Swimming_fractional_count_pool():
+    data = [720, 1, 80, 25.5, 40]
+    result = homework.read_package('SWM', data).get_spent_calories()
+    assert result == 339.20000000000005, (
+        'Дробное количество бассейнов не должно округляться.'
+    )
+    assert list(homework.read_package_batch('SWM', [data])) == [result]
+    assert list(homework.read_packages([('SWM', data)])['SWM']) == [result]
+
+
+def test_calories_batch_int_columns():
+    result = homework.Running.calories_batch(
+        np.array([9000, 1206]), np.array([1, 12]), np.array([75, 6])
+    )
+    assert list(result) == [481.90500000000003, 12.812472], (
+        '`calories_batch` должен принимать целочисленные массивы.'
+    )
+
+
+def test_read_package_str_subclass():
+    workout_type = np.str_('RUN')
+    data = [15000, 1, 75]
+    expected = homework.read_package('RUN', data).get_spent_calories()
+    training = homework.read_package(workout_type, data)
+    assert training.get_spent_calories() == expected
+    assert list(homework.read_package_batch(workout_type, [data])) == [
+        expected
+    ]
+    result = homework.read_packages([(workout_type, data)])
+    assert list(result['RUN']) == [expected]
+    assert type(next(iter(result))) is str